@@ -1,19 +1,30 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import datetime as dt
+from tkinter import ttk
+from array import array
+import bisect
+import importlib.util
 import json
 import os
+import re
 import threading
 import time
 import winsound
 
-# ---- Optional Windows lock/unlock support (pywin32) ----
-PYWIN32_OK = False
+# ---- Optional fast JSON (orjson), stdlib fallback ----
 try:
-    import win32con, win32gui, win32api, win32ts
-    PYWIN32_OK = True
+    import orjson
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
 except Exception:
-    PYWIN32_OK = False
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    _loads = json.loads
+
+# ---- Optional Windows lock/unlock support (pywin32) ----
+# Detect availability cheaply; the heavy imports happen lazily in
+# SessionWatcher.run so startup doesn't pay for them.
+PYWIN32_OK = importlib.util.find_spec("win32gui") is not None
 
 CONFIG_FILE = "alarms_v3.json"
 
@@ -29,23 +40,20 @@ DEFAULT_SETTINGS = {
     "pause_on_lock": True
 }
 
+# Validates and range-checks HH:MM in one pass (hour 0–23, minute 0–59)
+_HHMM_RE = re.compile(r"\s*([01]?\d|2[0-3]):([0-5]?\d)\s*")
+
 def parse_hhmm(hhmm: str):
-    s = hhmm.strip()
-    if ":" not in s:
-        raise ValueError("Use HH:MM (24h)")
-    h_str, m_str = s.split(":", 1)
-    if not (h_str.isdigit() and m_str.isdigit()):
-        raise ValueError("Hour/Minute must be numbers")
-    h, m = int(h_str), int(m_str)
-    if not (0 <= h <= 23 and 0 <= m <= 59):
-        raise ValueError("Hour 0–23, Minute 0–59")
-    return h, m
+    m = _HHMM_RE.fullmatch(hhmm)
+    if not m:
+        raise ValueError("Use HH:MM (24h), Hour 0–23, Minute 0–59")
+    return int(m.group(1)), int(m.group(2))
 
 def load_config():
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(CONFIG_FILE, "rb") as f:
+                data = _loads(f.read())
             # Back-compat: if file is a list, wrap into dict
             if isinstance(data, list):
                 return {
@@ -82,8 +90,12 @@ def save_config(alarms_vars, default_ringtone, pause_on_lock):
             "time":  rv["time_var"].get().strip(),
             "enabled": bool(rv["enabled_var"].get())
         })
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Write to a temp file and rename so a crash mid-write can't truncate
+    # the existing config
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_dumps(data))
+    os.replace(tmp, CONFIG_FILE)
 
 class Beeper:
     """Fallback beeper (used when no WAV chosen)."""
@@ -99,24 +111,23 @@ class Beeper:
     def _run(self):
         while not self._stop.is_set():
             winsound.Beep(1000, 500)
-            for _ in range(10):
-                if self._stop.is_set(): break
-                time.sleep(0.03)
+            if self._stop.wait(0.3):
+                break
     def stop(self):
         self._stop.set()
 
 class SoundPlayer:
-    """Plays looping WAV via winsound, or falls back to Beeper."""
+    """Plays a looping in-memory WAV via winsound, or falls back to Beeper."""
     def __init__(self):
         self.beeper = Beeper()
         self._using_wav = False
-    def play(self, wav_path: str | None):
+    def play(self, wav_bytes: bytes | None):
         self.stop()
-        if wav_path and os.path.exists(wav_path):
+        if wav_bytes:
             try:
                 winsound.PlaySound(
-                    wav_path,
-                    winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_LOOP
+                    wav_bytes,
+                    winsound.SND_MEMORY | winsound.SND_ASYNC | winsound.SND_LOOP
                 )
                 self._using_wav = True
                 return
@@ -148,9 +159,22 @@ class SessionWatcher(threading.Thread):
         self.hinst = None
         self.classAtom = None
         self.hwnd = None
+        self._win32con = None
+        self._win32gui = None
+        self._win32event = None
+        self._stop_evt = None
 
     def run(self):
         try:
+            # Deferred so app startup doesn't import pywin32
+            import win32api, win32con, win32event, win32gui, win32ts
+        except Exception:
+            return
+        self._win32con = win32con
+        self._win32gui = win32gui
+        self._win32event = win32event
+        try:
+            self._stop_evt = win32event.CreateEvent(None, 0, 0, None)
             wc = win32gui.WNDCLASS()
             self.hinst = wc.hInstance = win32api.GetModuleHandle(None)
             wc.lpszClassName = "SessionWatcherHiddenWindow"
@@ -162,7 +186,17 @@ class SessionWatcher(threading.Thread):
             )
             # Register for this session's notifications
             win32ts.WTSRegisterSessionNotification(self.hwnd, self.NOTIFY_FOR_THIS_SESSION)
-            win32gui.PumpMessages()
+            # Sleep until either a window message arrives or stop() signals
+            # the event — no polling, and shutdown doesn't depend on a
+            # message reaching the hidden window.
+            while True:
+                r = win32event.MsgWaitForMultipleObjects(
+                    [self._stop_evt], 0, win32event.INFINITE, win32event.QS_ALLINPUT
+                )
+                if r == win32event.WAIT_OBJECT_0:
+                    break
+                if win32gui.PumpWaitingMessages():
+                    break  # WM_QUIT
         except Exception:
             # Silent exit; if this fails we simply won't pause on lock
             pass
@@ -175,7 +209,15 @@ class SessionWatcher(threading.Thread):
             except Exception:
                 pass
 
+    def stop(self):
+        if self._stop_evt is not None and self._win32event is not None:
+            try:
+                self._win32event.SetEvent(self._stop_evt)
+            except Exception:
+                pass
+
     def _wndproc(self, hwnd, msg, wparam, lparam):
+        win32con, win32gui = self._win32con, self._win32gui
         if msg == self.WM_WTSSESSION_CHANGE:
             if wparam == self.WTS_SESSION_LOCK:
                 try:
@@ -200,25 +242,53 @@ class InfiniteAlarmApp:
         self.rows_vars = []       # alarms UI rows
         self.armed = False
         self.fired_today = set()
+        lt = time.localtime()
+        self._today = (lt.tm_year, lt.tm_mon, lt.tm_mday)  # for midnight rollover
+        self._scheduled = {}      # row idx -> Tk after-id for the pending fire callback
+        # Pending-alarm schedule as parallel sorted arrays (timestamps and
+        # row indices); bisect on _sched_ts finds the due prefix directly
+        self._sched_ts = array("d")
+        self._sched_idx = array("i")
+        self._geom_dirty = True   # row y/height caches need a refresh
+        self._scroll_pending = False  # an after_idle scrollregion update is queued
+        self._visible = True      # window mapped; drop the tick rate when it isn't
+        self._alarm_popup = None  # pooled popup Toplevel, built on first fire
+        self._alarm_idx = None    # row the visible popup belongs to
+        self._dirty = True        # unsaved changes exist; Save is a no-op when clean
+        self._enabled_idx = set() # indices of enabled rows, mirrored from Tk vars
         self.player = SoundPlayer()
 
         # lock/pause state
         self.paused = False
         self.pause_on_lock_var = tk.BooleanVar(value=True if PYWIN32_OK else False)
         self.default_ringtone_path = ""
+        self._wav_bytes = None    # ringtone preloaded into memory; None = beep
+        self._ringtone_valid = False  # cached os.path.exists for the chosen path
         self.ringtone_var = tk.StringVar(value="Ringtone: Beep (default)")
+        self._last_status = None      # last strings pushed to Tk, to skip
+        self._last_ringtone = None    # redundant variable writes
 
         self._build_ui()
         self._load_existing()
+        # What's on screen now mirrors the config file (if there is one)
+        self._dirty = not os.path.exists(CONFIG_FILE)
+        self.pause_on_lock_var.trace_add("write", self._mark_dirty)
         self._tick()
 
         # Session watcher (only if pywin32 present)
         if PYWIN32_OK:
-            self.pause_on_lock_var.set(self.pause_on_lock_var.get())
             self._start_session_watcher()
 
+        self.root.bind("<Map>", lambda e: self._on_visibility(e, True))
+        self.root.bind("<Unmap>", lambda e: self._on_visibility(e, False))
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
+    def _on_visibility(self, event, visible):
+        # Toplevel bindings also see children's <Map>/<Unmap>; only the root
+        # window's own events reflect minimize/restore.
+        if event.widget is self.root:
+            self._visible = visible
+
     def _build_ui(self):
         pad = {"padx": 8, "pady": 6}
         header = ttk.Label(self.root, text="Alarms for Today (HH:MM 24-hour) — unlimited rows", font=("Segoe UI", 12, "bold"))
@@ -273,7 +343,7 @@ class InfiniteAlarmApp:
         self.scroll_y = ttk.Scrollbar(self.root, orient="vertical", command=self.canvas.yview)
         self.rows_frame = ttk.Frame(self.canvas)
 
-        self.rows_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        self.rows_frame.bind("<Configure>", self._on_rows_configure)
         self.canvas.create_window((0, 0), window=self.rows_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scroll_y.set)
 
@@ -308,20 +378,79 @@ class InfiniteAlarmApp:
         tminus_lbl.grid(row=0, column=4, padx=4, sticky="w")
         sel_chk.grid(row=0, column=5, padx=4, sticky="w")
 
-        return {
+        rv = {
             "frame": r,
+            "num_label": num,
+            "_last_num": idx + 1,
             "enabled_var": enabled_var,
             "label_var": label_var,
             "time_var": time_var,
             "tminus_var": tminus_var,
-            "select_var": sel_var
+            "select_var": sel_var,
+            # parse cache: (h, m) for _parsed_src, so _tick doesn't re-parse
+            # unchanged strings every second
+            "_parsed": None,
+            "_parsed_src": None,
+            # today's target as a unix timestamp; None = needs rebuild
+            "_target_ts": None,
+            # display caches: last T-minus string written, row geometry
+            "_last_tminus": None,
+            "_y": 0,
+            "_h": 0,
+            # Python-side mirror of enabled_var, so hot loops skip the
+            # Tcl round-trip of enabled_var.get()
+            "_enabled": bool(data.get("enabled", True))
         }
+        label_var.trace_add("write", self._mark_dirty)
+        time_var.trace_add("write", lambda *_: self._on_time_edited(rv))
+        enabled_var.trace_add("write", lambda *_: self._on_enabled_toggled(rv))
+        return rv
+
+    def _mark_dirty(self, *_):
+        self._dirty = True
+
+    def _on_time_edited(self, rv):
+        rv["_target_ts"] = None
+        self._dirty = True
+        if self.armed:
+            self._reschedule_all()
+
+    def _on_enabled_toggled(self, rv):
+        rv["_enabled"] = bool(rv["enabled_var"].get())
+        self._dirty = True
+        self._rebuild_enabled_idx()
+        self._reschedule_all()
+
+    def _rebuild_enabled_idx(self):
+        self._enabled_idx = {i for i, rv in enumerate(self.rows_vars) if rv["_enabled"]}
+
+    def _get_parsed(self, rv):
+        """Cached parse_hhmm for a row; re-parses only when the text changed."""
+        t_str = rv["time_var"].get()
+        if rv["_parsed"] is not None and rv["_parsed_src"] == t_str:
+            return rv["_parsed"]
+        parsed = parse_hhmm(t_str)
+        rv["_parsed"] = parsed
+        rv["_parsed_src"] = t_str
+        return parsed
+
+    def _get_target_ts(self, rv):
+        """Timestamp of today's target for a row; rebuilt only after an edit
+        or a date change — callers compare plain floats against it."""
+        ts = rv["_target_ts"]
+        if ts is not None:
+            return ts
+        h, m = self._get_parsed(rv)
+        lt = time.localtime()
+        ts = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday, h, m, 0, -1, -1, -1))
+        rv["_target_ts"] = ts
+        return ts
 
     def _refresh_numbers(self):
         for i, rv in enumerate(self.rows_vars):
-            children = rv["frame"].winfo_children()
-            if len(children) >= 2 and isinstance(children[1], ttk.Label):
-                children[1].configure(text=str(i+1))
+            if rv["_last_num"] != i + 1:
+                rv["num_label"].configure(text=str(i+1))
+                rv["_last_num"] = i + 1
 
     def _add_row(self, preset=None, at_end=True):
         idx = len(self.rows_vars) if at_end else 0
@@ -335,39 +464,69 @@ class InfiniteAlarmApp:
                 r["frame"].grid_forget()
                 r["frame"].grid(row=i, column=0, sticky="w")
         self._refresh_numbers()
+        self._rebuild_enabled_idx()
+        self._dirty = True
+        self._reschedule_all()  # a row added while armed must get its callback
         self.canvas.yview_moveto(1.0)
 
+    def _begin_bulk(self):
+        # Suspend the <Configure> scrollregion handler so a K-row mutation
+        # triggers one geometry pass instead of K.
+        self.rows_frame.bind("<Configure>", "")
+
+    def _end_bulk(self):
+        self.rows_frame.bind("<Configure>", self._on_rows_configure)
+        self._on_rows_configure()
+
     def _duplicate_selected(self):
+        from tkinter import messagebox
         sel = [rv for rv in self.rows_vars if rv["select_var"].get()]
         if not sel:
             messagebox.showinfo("Duplicate", "Select at least one row.")
             return
-        for rv in sel:
-            self._add_row(
-                preset={
-                    "label": rv["label_var"].get(),
-                    "time": rv["time_var"].get(),
-                    "enabled": rv["enabled_var"].get()
-                },
-                at_end=True
-            )
+        self._begin_bulk()
+        try:
+            for rv in sel:
+                self._add_row(
+                    preset={
+                        "label": rv["label_var"].get(),
+                        "time": rv["time_var"].get(),
+                        "enabled": rv["enabled_var"].get()
+                    },
+                    at_end=True
+                )
+        finally:
+            self._end_bulk()
 
     def _delete_selected(self):
+        from tkinter import messagebox
         indices = [i for i, rv in enumerate(self.rows_vars) if rv["select_var"].get()]
         if not indices:
             messagebox.showinfo("Delete", "Select at least one row.")
             return
-        for i in reversed(indices):
-            rv = self.rows_vars.pop(i)
-            rv["frame"].destroy()
+        self._begin_bulk()
+        try:
+            for i in reversed(indices):
+                rv = self.rows_vars.pop(i)
+                rv["frame"].destroy()
+        finally:
+            self._end_bulk()
         self._refresh_numbers()
+        self._rebuild_enabled_idx()
+        self._dirty = True
+        self._reschedule_all()  # row indices shifted; pending after() ids are stale
 
     def _load_existing(self):
         cfg = load_config()
         alarms = cfg.get("alarms", DEFAULT_ALARMS)
-        for item in alarms:
-            self._add_row(preset=item, at_end=True)
+        self._begin_bulk()
+        try:
+            for item in alarms:
+                self._add_row(preset=item, at_end=True)
+        finally:
+            self._end_bulk()
         self.default_ringtone_path = cfg.get("default_ringtone", "") or ""
+        self._load_ringtone_bytes()
         self._update_ringtone_label()
         pol = bool(cfg.get("pause_on_lock", True))
         if PYWIN32_OK:
@@ -376,49 +535,72 @@ class InfiniteAlarmApp:
             self.pause_on_lock_var.set(False)
 
     def _save(self):
+        from tkinter import messagebox
+        if not self._dirty:
+            messagebox.showinfo("Saved", "No changes since last save.")
+            return
         try:
             for rv in self.rows_vars:
                 if rv["enabled_var"].get() and rv["time_var"].get().strip():
                     parse_hhmm(rv["time_var"].get())
             save_config(self.rows_vars, self.default_ringtone_path, self.pause_on_lock_var.get())
+            self._dirty = False
             messagebox.showinfo("Saved", "Alarm list + settings saved.")
         except Exception as e:
             messagebox.showerror("Invalid time", f"Please fix times: {e}")
 
     def _pick_wav(self):
+        from tkinter import filedialog
         path = filedialog.askopenfilename(
             title="Choose WAV ringtone",
             filetypes=[("WAV files", "*.wav"), ("All files", "*.*")]
         )
         if path:
             self.default_ringtone_path = path
+            self._dirty = True
+            self._load_ringtone_bytes()
             self._update_ringtone_label()
 
     def _clear_wav(self):
         self.default_ringtone_path = ""
+        self._wav_bytes = None
+        self._ringtone_valid = False
+        self._dirty = True
         self._update_ringtone_label()
 
+    def _load_ringtone_bytes(self):
+        """Read the chosen WAV into memory once, so firing never hits disk.
+        Also caches the path-exists check — the only stat for this path."""
+        self._wav_bytes = None
+        path = self.default_ringtone_path
+        self._ringtone_valid = bool(path) and os.path.exists(path)
+        if self._ringtone_valid:
+            try:
+                with open(path, "rb") as f:
+                    self._wav_bytes = f.read()
+            except Exception:
+                self._wav_bytes = None
+
     def _update_ringtone_label(self):
-        if self.default_ringtone_path and os.path.exists(self.default_ringtone_path):
+        if self.default_ringtone_path and self._ringtone_valid:
             base = os.path.basename(self.default_ringtone_path)
-            self.ringtone_var.set(f"Ringtone: {base}")
+            self._set_ringtone_text(f"Ringtone: {base}")
         else:
-            self.ringtone_var.set("Ringtone: Beep (default)")
+            self._set_ringtone_text("Ringtone: Beep (default)")
 
     def _start_all(self):
+        from tkinter import messagebox
         try:
-            now = dt.datetime.now()
+            now_ts = time.time()
             self.fired_today.clear()
             any_enabled = False
             for idx, rv in enumerate(self.rows_vars):
-                if not rv["enabled_var"].get():
+                if idx not in self._enabled_idx:
                     continue
                 t_str = rv["time_var"].get().strip()
                 if not t_str:
                     continue
-                h, m = parse_hhmm(t_str)
-                target = now.replace(hour=h, minute=m, second=0, microsecond=0)
-                if target <= now:
+                if self._get_target_ts(rv) <= now_ts:
                     # If already passed at start time, mark as fired (skip)
                     self.fired_today.add(idx)
                 any_enabled = True
@@ -426,15 +608,96 @@ class InfiniteAlarmApp:
                 messagebox.showwarning("No alarms", "Turn on at least one alarm with a valid time.")
                 return
             self.armed = True
-            self.status_var.set(f"Status: Armed at {now.strftime('%H:%M:%S')} (today only)")
+            self._reschedule_all()
+            self._set_status(f"Status: Armed at {time.strftime('%H:%M:%S')} (today only)")
         except Exception as e:
             messagebox.showerror("Invalid time", f"Please fix times: {e}")
 
     def _stop_all(self):
         self.armed = False
-        self.status_var.set("Status: Not armed")
+        self._cancel_scheduled()
+        self._set_status("Status: Not armed")
         self.player.stop()
 
+    # ---------- Event-driven firing (one after() per pending alarm) ----------
+    def _cancel_scheduled(self):
+        for after_id in self._scheduled.values():
+            try:
+                self.root.after_cancel(after_id)
+            except Exception:
+                pass
+        self._scheduled.clear()
+
+    def _reschedule_all(self):
+        """Rebuild the per-alarm after() callbacks. Called whenever row
+        indices, times, or enabled flags may have changed."""
+        self._cancel_scheduled()
+        pending = []
+        if self.armed:
+            now_ts = time.time()
+            for idx, rv in enumerate(self.rows_vars):
+                if idx in self.fired_today:
+                    continue
+                if idx not in self._enabled_idx:
+                    continue
+                if not rv["time_var"].get().strip():
+                    continue
+                try:
+                    target_ts = self._get_target_ts(rv)
+                except Exception:
+                    continue
+                pending.append((target_ts, idx))
+                ms = int((target_ts - now_ts) * 1000)
+                if ms <= 0:
+                    continue
+                self._scheduled[idx] = self.root.after(ms, lambda i=idx: self._on_alarm_due(i))
+        pending.sort()
+        self._sched_ts = array("d", (ts for ts, _ in pending))
+        self._sched_idx = array("i", (i for _, i in pending))
+
+    def _on_alarm_due(self, idx):
+        self._scheduled.pop(idx, None)
+        if not self.armed or idx in self.fired_today:
+            return
+        if self.paused and self.pause_on_lock_var.get():
+            return  # _handle_unlock catches up on missed alarms
+        if idx >= len(self.rows_vars):
+            return
+        rv = self.rows_vars[idx]
+        if idx not in self._enabled_idx:
+            return
+        self._fire_alarm(idx, rv["label_var"].get().strip() or f"Alarm {idx+1}")
+        self.fired_today.add(idx)
+
+    def _on_rows_configure(self, event=None):
+        # <Configure> fires once per child resize; coalesce the bursts so the
+        # bbox recomputation runs once per idle cycle, not once per row.
+        self._geom_dirty = True
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.root.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._scroll_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _set_tminus(self, rv, value):
+        # Writing a StringVar fires traces and a redraw even when the value
+        # is unchanged, so only push real changes to Tk.
+        if rv["_last_tminus"] != value:
+            rv["tminus_var"].set(value)
+            rv["_last_tminus"] = value
+
+    def _set_status(self, value):
+        if self._last_status != value:
+            self.status_var.set(value)
+            self._last_status = value
+
+    def _set_ringtone_text(self, value):
+        if self._last_ringtone != value:
+            self.ringtone_var.set(value)
+            self._last_ringtone = value
+
     def _fmt_tminus(self, secs):
         if secs < 0:
             return "—"
@@ -447,82 +710,103 @@ class InfiniteAlarmApp:
             return f"{m:02d}:{s:02d}"
 
     def _tick(self):
-        now = dt.datetime.now()
+        now_lt = time.localtime()
+        today = (now_lt.tm_year, now_lt.tm_mon, now_lt.tm_mday)
 
-        # Update T-minus display
+        # Midnight rollover: cached targets belong to yesterday, rebuild lazily
+        if today != self._today:
+            self._today = today
+            for rv in self.rows_vars:
+                rv["_target_ts"] = None
+            self._reschedule_all()
+
+        # Update T-minus display — visible rows only, integer seconds-of-day
+        # arithmetic (no datetime objects on this path)
+        cur_sec = now_lt.tm_hour * 3600 + now_lt.tm_min * 60 + now_lt.tm_sec
+        top = self.canvas.canvasy(0)
+        bot = top + self.canvas.winfo_height()
+        if self._geom_dirty:
+            for rv in self.rows_vars:
+                rv["_y"] = rv["frame"].winfo_y()
+                rv["_h"] = rv["frame"].winfo_height()
+            self._geom_dirty = False
         for idx, rv in enumerate(self.rows_vars):
+            if rv["_y"] + rv["_h"] < top or rv["_y"] > bot:
+                continue  # off-screen; skip the Tk write entirely
             t_str = rv["time_var"].get().strip()
             if not t_str:
-                rv["tminus_var"].set("—")
+                self._set_tminus(rv, "—")
                 continue
             try:
-                h, m = parse_hhmm(t_str)
-                target = now.replace(hour=h, minute=m, second=0, microsecond=0)
-                delta_sec = int((target - now).total_seconds())
-                if (idx in self.fired_today) or (not rv["enabled_var"].get()):
-                    rv["tminus_var"].set("—")
+                h, m = self._get_parsed(rv)
+                delta_sec = (h * 60 + m) * 60 - cur_sec
+                if (idx in self.fired_today) or (idx not in self._enabled_idx):
+                    self._set_tminus(rv, "—")
                 else:
-                    rv["tminus_var"].set(self._fmt_tminus(delta_sec))
+                    self._set_tminus(rv, self._fmt_tminus(delta_sec))
             except Exception:
-                rv["tminus_var"].set("ERR")
-
-        # Fire logic
-        if self.armed and not (self.paused and self.pause_on_lock_var.get()):
-            for idx, rv in enumerate(self.rows_vars):
-                if idx in self.fired_today:
-                    continue
-                if not rv["enabled_var"].get():
-                    continue
-                t_str = rv["time_var"].get().strip()
-                if not t_str:
-                    continue
-                try:
-                    h, m = parse_hhmm(t_str)
-                except Exception:
-                    continue
-                target = now.replace(hour=h, minute=m, second=0, microsecond=0)
-                delta = (now - target).total_seconds()
-                if -1 <= delta <= 3:
-                    self._fire_alarm(idx, rv["label_var"].get().strip() or f"Alarm {idx+1}")
-                    self.fired_today.add(idx)
-                elif delta > 3:
-                    # Only skip (mark fired) if NOT paused. If paused, we want to catch up on unlock.
-                    if not self.paused or not self.pause_on_lock_var.get():
-                        self.fired_today.add(idx)
+                self._set_tminus(rv, "ERR")
 
-        self.root.after(1000, self._tick)
-
-    def _fire_alarm(self, idx, label_text):
-        # Start sound (WAV or beep)
-        self.player.play(self.default_ringtone_path)
+        # Nobody sees the countdown while minimized, so tick slower; firing
+        # stays exact either way since it runs off scheduled after() callbacks.
+        self.root.after(1000 if self._visible else 5000, self._tick)
 
+    def _build_alarm_popup(self):
+        """Build the (single, reused) alarm popup. Creating a Toplevel plus
+        themed widgets per fire is needless Tk allocation — the popup is
+        created once, then reconfigured and shown/hidden per alarm."""
         popup = tk.Toplevel(self.root)
         popup.title("⏰ Alarm")
         popup.resizable(False, False)
+        popup.withdraw()
 
-        ttk.Label(popup, text=f"⏰ {label_text}", font=("Segoe UI", 14, "bold")).grid(row=0, column=0, columnspan=2, padx=16, pady=(16, 8))
-        ttk.Label(popup, text=dt.datetime.now().strftime("%H:%M")).grid(row=1, column=0, columnspan=2, padx=16, pady=(0, 8))
+        self._alarm_title_var = tk.StringVar()
+        self._alarm_time_var = tk.StringVar()
+        ttk.Label(popup, textvariable=self._alarm_title_var, font=("Segoe UI", 14, "bold")).grid(row=0, column=0, columnspan=2, padx=16, pady=(16, 8))
+        ttk.Label(popup, textvariable=self._alarm_time_var).grid(row=1, column=0, columnspan=2, padx=16, pady=(0, 8))
+        ttk.Button(popup, text="Dismiss", command=self._dismiss_alarm).grid(row=2, column=0, padx=10, pady=(0, 14))
+        ttk.Button(popup, text="Snooze 5 min", command=self._snooze_alarm).grid(row=2, column=1, padx=10, pady=(0, 14))
 
-        def dismiss():
-            self.player.stop()
-            popup.destroy()
+        popup.protocol("WM_DELETE_WINDOW", self._dismiss_alarm)
+        self._alarm_popup = popup
 
-        def snooze5():
-            self.player.stop()
-            now = dt.datetime.now()
-            new_time = (now + dt.timedelta(minutes=5)).strftime("%H:%M")
-            self.rows_vars[idx]["time_var"].set(new_time)
-            if idx in self.fired_today:
-                self.fired_today.remove(idx)
-            popup.destroy()
-            messagebox.showinfo("Snoozed", f"Snoozed to {new_time}")
+    def _fire_alarm(self, idx, label_text):
+        # Start sound (preloaded WAV or beep)
+        self.player.play(self._wav_bytes)
 
-        ttk.Button(popup, text="Dismiss", command=dismiss).grid(row=2, column=0, padx=10, pady=(0, 14))
-        ttk.Button(popup, text="Snooze 5 min", command=snooze5).grid(row=2, column=1, padx=10, pady=(0, 14))
+        if self._alarm_popup is None:
+            self._build_alarm_popup()
+        self._alarm_idx = idx
+        self._alarm_title_var.set(f"⏰ {label_text}")
+        self._alarm_time_var.set(time.strftime("%H:%M"))
 
+        popup = self._alarm_popup
+        popup.deiconify()
         popup.attributes("-topmost", True)
         popup.grab_set()
 
+    def _hide_alarm_popup(self):
+        self.player.stop()
+        try:
+            self._alarm_popup.grab_release()
+        except Exception:
+            pass
+        self._alarm_popup.withdraw()
+
+    def _dismiss_alarm(self):
+        self._hide_alarm_popup()
+
+    def _snooze_alarm(self):
+        from tkinter import messagebox
+        idx = self._alarm_idx
+        new_time = time.strftime("%H:%M", time.localtime(time.time() + 300))
+        self.rows_vars[idx]["time_var"].set(new_time)
+        if idx in self.fired_today:
+            self.fired_today.remove(idx)
+        self._reschedule_all()
+        self._hide_alarm_popup()
+        messagebox.showinfo("Snoozed", f"Snoozed to {new_time}")
+
     # ---------- Pause on lock / resume on unlock ----------
     def _start_session_watcher(self):
         def on_lock():
@@ -538,52 +822,34 @@ class InfiniteAlarmApp:
         if not self.pause_on_lock_var.get():
             return
         self.paused = True
+        self._cancel_scheduled()
         self.player.stop()  # stop any ringing sound
-        self.status_var.set("Status: Paused (Windows locked)")
+        self._set_status("Status: Paused (Windows locked)")
 
     def _handle_unlock(self):
         if not self.pause_on_lock_var.get():
             return
         self.paused = False
-        self.status_var.set("Status: Resumed (Windows unlocked)")
-        # Fire any alarms that became due while paused
+        self._set_status("Status: Resumed (Windows unlocked)")
+        # Fire any alarms that became due while paused. _sched_ts is sorted,
+        # so the due prefix is a single bisect away.
         if self.armed:
             try:
-                now = dt.datetime.now()
-                due = []
-                for idx, rv in enumerate(self.rows_vars):
-                    if idx in self.fired_today: 
-                        continue
-                    if not rv["enabled_var"].get():
-                        continue
-                    t_str = rv["time_var"].get().strip()
-                    if not t_str:
+                k = bisect.bisect_right(self._sched_ts, time.time())
+                for idx in self._sched_idx[:k]:
+                    if idx in self.fired_today or idx >= len(self.rows_vars):
                         continue
-                    try:
-                        h, m = parse_hhmm(t_str)
-                    except Exception:
-                        continue
-                    target = now.replace(hour=h, minute=m, second=0, microsecond=0)
-                    if target <= now:
-                        due.append((target, idx))
-                due.sort()
-                for _, idx in due:
                     self._fire_alarm(idx, self.rows_vars[idx]["label_var"].get().strip() or f"Alarm {idx+1}")
                     self.fired_today.add(idx)
             except Exception:
                 pass
+            self._reschedule_all()
 
     def _on_close(self):
         self.player.stop()
-        try:
-            # Best-effort: send WM_DESTROY to watcher window so PumpMessages exits
-            if hasattr(self, "session_watcher") and getattr(self.session_watcher, "hwnd", None):
-                try:
-                    win32gui.PostMessage(self.session_watcher.hwnd, win32con.WM_DESTROY, 0, 0)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        watcher = getattr(self, "session_watcher", None)
+        if watcher is not None:
+            watcher.stop()
         self.root.destroy()
 
 if __name__ == "__main__":